@@ -7,6 +7,9 @@ LIGHT_TRAIL_INTERVAL = range(6, 15)
 MEDIUM_TRAIL_INTERVAL = range(51, 64)
 HEAVY_TRAIL_INTERVAL = range(98, 127)
 BASE_MODEL_SWITCH = 1
+THREAT_SEARCH_RADIUS = 1
+NESTMATE_SEARCH_RADIUS = 4
+TRAIL_SEARCH_RADIUS = 1
 
 
 class ActivityState(Enum):
@@ -48,10 +51,10 @@ class LNiger(Ant):
         self.pheromone_step_weight = 10
 
         # A variable describing the radius from which this ant will identify a threat
-        self.threat_search_radius = 1
+        self.threat_search_radius = THREAT_SEARCH_RADIUS
 
         # A variable describing the radius from which this ant will count "nearby" nestmates
-        self.nestmate_search_radius = 4
+        self.nestmate_search_radius = NESTMATE_SEARCH_RADIUS
 
         # A variable describing the radius an ant has to be at from a colony to be "tending" that colony
         self.colony_tending_radius = 4
@@ -59,6 +62,9 @@ class LNiger(Ant):
         # Variable describing the number of "nearby" nestmates
         self.nearby_nestmates = 0
 
+        # The inputs to our last aggressiveness update, used by the event-driven model to skip re-evaluating it
+        self.last_aggro_inputs = None
+
     def _init_post_place(self):
         """
         An initialization method to be run after the agent is placed.
@@ -89,7 +95,7 @@ class LNiger(Ant):
         # Choose a new position and move there
         if sum(step_weights) != 0:
             new_position = random.choices(possible_steps, weights=step_weights, k=1)[0]
-            self.model.grid.move_agent(self, new_position)
+            self.model.move_agent(self, new_position)
 
         # Update internal states
         self.update_state()
@@ -161,6 +167,8 @@ class LNiger(Ant):
         :param radius: Number of squares outward to search.
         :return: int
         """
+        if self.model.event_driven and radius == NESTMATE_SEARCH_RADIUS:
+            return int(self.model.nestmate_map[self.pos])
         return self.model.get_number_of_agents_in_radius(self.pos, radius, LNiger)
 
     def get_number_threats_nearby(self, radius):
@@ -169,6 +177,8 @@ class LNiger(Ant):
         :param radius: Number of squares outward to search.
         :return: int
         """
+        if self.model.event_driven and radius == THREAT_SEARCH_RADIUS:
+            return int(self.model.threat_map[self.pos])
         return self.model.get_number_of_agents_in_radius(self.pos, radius, FJaponica)
 
     def update_aggro_state_base_model(self):
@@ -236,11 +246,14 @@ class LNiger(Ant):
         else:
             self.update_aggro_state_new_model()
 
-    def get_average_number_surrounding_pheromones(self, radius=1):
+    def get_average_number_surrounding_pheromones(self, radius=TRAIL_SEARCH_RADIUS):
         """
         A method that returns the average of all the pheromone counts within a circle of radius radius.
         :return: The average number of surrounding pheromones, rounded up to the closest int.
         """
+        if self.model.event_driven:
+            return self.model.get_average_pheromone_tracks(self.pos, radius)
+
         total_surrounding_pher = 0
         surrounding_pher_count = 0
         for agent in self.model.grid.get_neighbors(self.pos, moore=True, radius=radius):
@@ -256,12 +269,9 @@ class LNiger(Ant):
         :return: None
         """
         # Check if we're actively tending any colonies and, if so, what type of colony.
-        if self.get_number_colonies_nearby(self.colony_tending_radius) > 0:
-            closest_colony = self.model.get_closest_colony(self)
-            if isinstance(closest_colony, FTropicalisColony):
-                self.activity_state = ActivityState.TEND_FT
-            if isinstance(closest_colony, MKuricolaColony):
-                self.activity_state = ActivityState.TEND_MK
+        tending_state = self.model.get_tending_state(self, self.colony_tending_radius)
+        if tending_state is not None:
+            self.activity_state = tending_state
             return
 
         # If we're not tending colonies, see how we're traveling.
@@ -281,10 +291,32 @@ class LNiger(Ant):
         depending on the factors we are considering, may depend on what type of trail we are on.z
         :return: None
         """
+        if self.model.event_driven:
+            self.update_state_event_driven()
+            return
+
         self.update_activity_state()
         self.update_aggro_state()
         self.nearby_nestmates = self.get_number_nestmates_nearby(self.nestmate_search_radius)
 
+    def update_state_event_driven(self):
+        """
+        Update our internal state from the model's event-driven maps. Our trail and nestmate states are cheap map
+        lookups, but they are still recomputed every step, since our own move and pheromone drop change them.
+        Our aggressiveness is only re-rolled when a threat enters or leaves our threat_search_radius or when an
+        input to the aggro model (activity state or, for the new model, nestmate count) changes, rather than
+        every step while a threat is present.
+        :return: None
+        """
+        self.update_activity_state()
+        self.nearby_nestmates = self.get_number_nestmates_nearby(self.nestmate_search_radius)
+
+        aggro_inputs = (int(self.model.threat_signature[self.pos]), self.activity_state,
+                        None if BASE_MODEL_SWITCH else self.nearby_nestmates)
+        if aggro_inputs != self.last_aggro_inputs:
+            self.last_aggro_inputs = aggro_inputs
+            self.update_aggro_state()
+
 
 class FJaponica(Ant):
     """
@@ -293,6 +325,10 @@ class FJaponica(Ant):
     def __init__(self, unique_id, model):
         super().__init__(unique_id, model)
 
+        # A key XORed into the model's threat signature map, identifying which threats are near a cell. It is taken
+        # from the (random) uuid so that creating an agent does not draw from the simulation's random stream.
+        self.threat_key = self.unique_id.int & ((1 << 62) - 1)
+
     def step(self):
         # Gather viable (i.e., empty) steps
         possible_steps = self.model.grid.get_neighborhood(
@@ -311,7 +347,7 @@ class FJaponica(Ant):
 
         # Choose a new position and move there
         new_position = random.choices(possible_steps, weights=step_weights, k=1)[0]
-        self.model.grid.move_agent(self, new_position)
+        self.model.move_agent(self, new_position)
 
 
 class LNPheromone(Agent):
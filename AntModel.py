@@ -6,12 +6,13 @@ from AphidAgents import *
 from uuid import uuid4
 import numpy as np
 from mesa.datacollection import DataCollector
-from DataCollection import ant_state_collector
+from DataCollection import ant_state_collector, aggregate_model_reporters, compute_ln_state_snapshot
 import json
 
 
 class AntModel(Model):
-    def __init__(self, num_ln, num_fj, num_mk_col, num_ft_col, width, height):
+    def __init__(self, num_ln, num_fj, num_mk_col, num_ft_col, width, height,
+                 collect_interval=1, collect_agents=True, agent_collect_interval=1, event_driven=False):
         """
         :param num_ln: Number of L. Niger agents
         :param num_fj: Number of F. Japonica agents
@@ -19,8 +20,14 @@ class AntModel(Model):
         :param num_ft_col: Number of F. Tropicalis colonies
         :param width: Width of the model grid
         :param height: Height of the model grid
+        :param collect_interval: Number of steps between collections of the aggregate model reporters
+        :param collect_agents: Whether to collect the per-agent states at all
+        :param agent_collect_interval: Number of steps between collections of the per-agent states
+        :param event_driven: Whether L. Niger agents only update their states when their surroundings change
         """
         super().__init__()
+        if collect_interval < 1 or agent_collect_interval < 1:
+            raise ValueError("Collection intervals must be at least 1 step.")
         self.num_ln = num_ln
         self.num_fj = num_fj
         self.num_mk_col = num_mk_col
@@ -28,6 +35,23 @@ class AntModel(Model):
         self.grid = MultiGrid(width, height, True)
         self.schedule = RandomActivation(self)
         self.running = True
+        self.num_pheromone_cells = 0
+        self.collect_interval = collect_interval
+        self.agent_collect_interval = agent_collect_interval
+        self.ln_state_snapshot = None
+
+        # Event-driven bookkeeping, kept up to date as agents move instead of being recomputed by every ant.
+        # threat_map holds the number of F. Japonica within THREAT_SEARCH_RADIUS of each cell and threat_signature
+        # the XOR of their threat_keys, so a change in signature means a threat entered or left range.
+        # nestmate_map holds the number of L. Niger within NESTMATE_SEARCH_RADIUS of each cell and pheromone_tracks
+        # the tracks of the pheromone in each cell. Colonies never move, so tending states are cached by cell.
+        self.event_driven = event_driven
+        self.threat_map = np.zeros((width, height), dtype=np.int64)
+        self.threat_signature = np.zeros((width, height), dtype=np.int64)
+        self.nestmate_map = np.zeros((width, height), dtype=np.int64)
+        self.pheromone_tracks = np.zeros((width, height), dtype=np.int64)
+        self.tending_state_cache = {}
+        self.neighborhood_index_cache = {}
 
         for h in range(self.num_fj):
             ant = FJaponica(uuid4(), self)
@@ -50,8 +74,17 @@ class AntModel(Model):
             self.grid.place_agent(ant, self.grid.find_empty())
             ant._init_post_place()
 
-        self.data_collector = DataCollector(model_reporters={},
-                                            agent_reporters={"states": ant_state_collector})
+        if self.event_driven:
+            for agent in self.schedule.agents:
+                if isinstance(agent, FJaponica):
+                    self.update_threat_map(agent, agent.pos, 1)
+                elif isinstance(agent, LNiger):
+                    self.update_nestmate_map(agent.pos, 1)
+
+        self.data_collector = DataCollector(model_reporters=aggregate_model_reporters())
+        self.agent_data_collector = None
+        if collect_agents:
+            self.agent_data_collector = DataCollector(agent_reporters={"states": ant_state_collector})
         self.weights_dict = json.load(open("newout.json","r"))
 
     def drop_pheromone(self, location):
@@ -63,8 +96,101 @@ class AntModel(Model):
         """
         if not self.is_pheromone_in_cell(location):
             self.grid.place_agent(LNPheromone(uuid4(), self), location)
+            self.num_pheromone_cells += 1
         else:
             self.get_pheromone_in_cell(location).tracks += 1
+        if self.event_driven:
+            self.pheromone_tracks[location] += 1
+
+    def move_agent(self, agent, location):
+        """
+        Moves an agent to the given location, keeping the event-driven threat and nestmate maps up to date.
+        :param agent: The agent to move.
+        :param location: An (x, y) tuple detailing the location to move to.
+        :return: None
+        """
+        old_location = agent.pos
+        self.grid.move_agent(agent, location)
+        if not self.event_driven:
+            return
+        if isinstance(agent, FJaponica):
+            self.update_threat_map(agent, old_location, -1)
+            self.update_threat_map(agent, location, 1)
+        elif isinstance(agent, LNiger):
+            self.update_nestmate_map(old_location, -1)
+            self.update_nestmate_map(location, 1)
+
+    def get_neighborhood_index(self, location, radius):
+        """
+        Returns the cells within radius (not including center) of location as a pair of numpy index arrays.
+        :param location: Location to search around.
+        :param radius: Radius to search.
+        :return: A tuple of x and y index arrays.
+        """
+        key = (location, radius)
+        if key not in self.neighborhood_index_cache:
+            cells = self.grid.get_neighborhood(location, moore=True, include_center=False, radius=radius)
+            self.neighborhood_index_cache[key] = (np.array([x for x, y in cells]), np.array([y for x, y in cells]))
+        return self.neighborhood_index_cache[key]
+
+    def update_threat_map(self, threat, location, change):
+        """
+        Updates the threat count and signature of every cell within THREAT_SEARCH_RADIUS of location.
+        :param threat: The FJaponica arriving at or leaving location.
+        :param location: The location of the threat.
+        :param change: 1 when the threat arrives at location, -1 when it leaves.
+        :return: None
+        """
+        index = self.get_neighborhood_index(location, THREAT_SEARCH_RADIUS)
+        self.threat_map[index] += change
+        self.threat_signature[index] ^= threat.threat_key
+
+    def update_nestmate_map(self, location, change):
+        """
+        Updates the nestmate count of every cell within NESTMATE_SEARCH_RADIUS of location.
+        :param location: The location of the L. Niger.
+        :param change: 1 when the L. Niger arrives at location, -1 when it leaves.
+        :return: None
+        """
+        self.nestmate_map[self.get_neighborhood_index(location, NESTMATE_SEARCH_RADIUS)] += change
+
+    def get_average_pheromone_tracks(self, location, radius):
+        """
+        Returns the average tracks of the pheromones within radius (not including center) of location, read from
+        the event-driven pheromone map.
+        :param location: Location to search around.
+        :param radius: Radius to search.
+        :return: The average number of tracks, rounded up to the closest int, or 0 if there are no pheromones.
+        """
+        tracks = self.pheromone_tracks[self.get_neighborhood_index(location, radius)]
+        pheromone_count = np.count_nonzero(tracks)
+        if pheromone_count == 0:
+            return 0
+        return np.ceil(tracks.sum() / pheromone_count)
+
+    def get_tending_state(self, agent, radius):
+        """
+        Returns the activity state of an agent tending the closest colony, or None if no colony is within radius.
+        Colonies never move, so in event-driven mode the result is cached by location.
+        :param agent: The agent to check.
+        :param radius: The radius an agent has to be within to tend a colony.
+        :return: ActivityState.TEND_FT, ActivityState.TEND_MK or None
+        """
+        key = (agent.pos, radius)
+        if self.event_driven and key in self.tending_state_cache:
+            return self.tending_state_cache[key]
+
+        tending_state = None
+        if self.get_number_of_agents_in_radius(agent.pos, radius, Colony) > 0:
+            closest_colony = self.get_closest_colony(agent)
+            if isinstance(closest_colony, FTropicalisColony):
+                tending_state = ActivityState.TEND_FT
+            if isinstance(closest_colony, MKuricolaColony):
+                tending_state = ActivityState.TEND_MK
+
+        if self.event_driven:
+            self.tending_state_cache[key] = tending_state
+        return tending_state
 
     def is_pheromone_in_cell(self, location):
         """
@@ -179,5 +305,9 @@ class AntModel(Model):
         A method called every step that occurs
         :return: None
         """
-        self.data_collector.collect(self)
+        if self.schedule.steps % self.collect_interval == 0:
+            self.ln_state_snapshot = compute_ln_state_snapshot(self)
+            self.data_collector.collect(self)
+        if self.agent_data_collector is not None and self.schedule.steps % self.agent_collect_interval == 0:
+            self.agent_data_collector.collect(self)
         self.schedule.step()
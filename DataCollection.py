@@ -1,6 +1,116 @@
-from AntAgents import LNiger
+from functools import partial
+import numpy as np
+from AntAgents import LNiger, ActivityState, AggroState
+
+# The largest nearby nestmate count given its own column in the aggregate output. This is every other cell within
+# the default nestmate_search_radius of 4; larger counts are added to the last column.
+MAX_NESTMATE_COUNT = 80
 
 
 def ant_state_collector(agent: LNiger):
     if isinstance(agent, LNiger):
         return agent.activity_state, agent.aggro_state, agent.nearby_nestmates
+
+
+def _aggro_state_value(aggro_state):
+    """
+    Returns the integer value of an aggro state. The base model stores the list returned by random.choices, so
+    this unwraps it before reading the value.
+    :param aggro_state: An AggroState or a single-element list containing one.
+    :return: int
+    """
+    if isinstance(aggro_state, list):
+        aggro_state = aggro_state[0]
+    return aggro_state.value
+
+
+def compute_ln_state_snapshot(model):
+    """
+    Gathers the state of every L. Niger agent into numpy arrays and computes the activity x aggro histogram and the
+    nestmate count distribution. AntModel.step computes this once before each aggregate collection so every
+    aggregate reporter shares a single pass over the agents.
+    :param model: The AntModel to collect from.
+    :return: A dictionary of numpy arrays.
+    """
+    ants = [x for x in model.schedule.agents if isinstance(x, LNiger)]
+    activity = np.fromiter((x.activity_state.value for x in ants), dtype=np.int64, count=len(ants))
+    aggro = np.fromiter((_aggro_state_value(x.aggro_state) for x in ants), dtype=np.int64, count=len(ants))
+    nestmates = np.fromiter((x.nearby_nestmates for x in ants), dtype=np.int64, count=len(ants))
+
+    num_aggro_states = len(AggroState)
+    histogram = np.bincount(activity * num_aggro_states + aggro,
+                            minlength=len(ActivityState) * num_aggro_states)
+    nestmate_distribution = np.bincount(np.minimum(nestmates, MAX_NESTMATE_COUNT), minlength=MAX_NESTMATE_COUNT + 1)
+    return {"activity": activity,
+            "aggro": aggro,
+            "nestmates": nestmates,
+            "histogram": histogram.reshape(len(ActivityState), num_aggro_states),
+            "nestmate_distribution": nestmate_distribution}
+
+
+def state_count_collector(model, activity_state, aggro_state):
+    """
+    Returns the number of L. Niger agents currently in the given activity and aggro states.
+    :param model: The AntModel to collect from.
+    :param activity_state: The ActivityState to count.
+    :param aggro_state: The AggroState to count.
+    :return: int
+    """
+    return int(model.ln_state_snapshot["histogram"][activity_state.value, aggro_state.value])
+
+
+def nestmate_count_collector(model, nestmate_count):
+    """
+    Returns the number of L. Niger agents with the given number of nearby nestmates.
+    :param model: The AntModel to collect from.
+    :param nestmate_count: The nearby nestmate count to look up.
+    :return: int
+    """
+    return int(model.ln_state_snapshot["nestmate_distribution"][nestmate_count])
+
+
+def mean_nearby_nestmates_collector(model):
+    """
+    Returns the mean number of nearby nestmates across all L. Niger agents.
+    :param model: The AntModel to collect from.
+    :return: float
+    """
+    nestmates = model.ln_state_snapshot["nestmates"]
+    return float(nestmates.mean()) if len(nestmates) > 0 else 0.0
+
+
+def fj_encounter_collector(model):
+    """
+    Returns the number of L. Niger agents currently responding to a F. Japonica threat.
+    :param model: The AntModel to collect from.
+    :return: int
+    """
+    return int(np.count_nonzero(model.ln_state_snapshot["aggro"] != AggroState.NO_THREAT.value))
+
+
+def trail_coverage_collector(model):
+    """
+    Returns the fraction of grid cells which contain a pheromone.
+    :param model: The AntModel to collect from.
+    :return: float
+    """
+    return model.num_pheromone_cells / (model.grid.width * model.grid.height)
+
+
+def aggregate_model_reporters():
+    """
+    Builds the model reporters for the aggregate statistics: one count per activity x aggro state combination,
+    one count per nearby nestmate count, the mean nearby nestmates, trail coverage and F. Japonica encounters.
+    :return: A dictionary of model reporters suitable for a mesa DataCollector.
+    """
+    reporters = {"Step": lambda m: m.schedule.steps}
+    for activity_state in ActivityState:
+        for aggro_state in AggroState:
+            reporters[activity_state.name + "/" + aggro_state.name] = \
+                partial(state_count_collector, activity_state=activity_state, aggro_state=aggro_state)
+    for nestmate_count in range(MAX_NESTMATE_COUNT + 1):
+        reporters["Nestmates=" + str(nestmate_count)] = partial(nestmate_count_collector, nestmate_count=nestmate_count)
+    reporters["Mean Nearby Nestmates"] = mean_nearby_nestmates_collector
+    reporters["Trail Coverage"] = trail_coverage_collector
+    reporters["FJ Encounters"] = fj_encounter_collector
+    return reporters
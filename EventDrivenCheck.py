@@ -0,0 +1,83 @@
+from AntModel import *
+from time import time
+
+# Default settings
+STEP_COUNT = 100
+NUM_LNIGER = 300
+NUM_FJAPON = 60
+NUM_MK_COL = 10
+NUM_FT_COL = 10
+GRID_WIDTH = 100
+GRID_HEIGHT = 100
+
+
+def count_event_map_mismatches(model):
+    """
+    Checks the model's event-driven maps against a brute-force count at every L. Niger location.
+    :param model: The event-driven AntModel to check.
+    :return: The number of L. Niger locations where a map disagrees with the grid.
+    """
+    mismatches = 0
+    for ant in model.get_all_of_agent_type(LNiger):
+        threats = [x for x in model.grid.get_neighbors(pos=ant.pos, moore=True, include_center=False,
+                                                       radius=THREAT_SEARCH_RADIUS)
+                   if isinstance(x, FJaponica)]
+        signature = 0
+        for threat in threats:
+            signature ^= threat.threat_key
+        pheromones = [x for x in model.grid.get_neighbors(pos=ant.pos, moore=True, include_center=False,
+                                                          radius=TRAIL_SEARCH_RADIUS)
+                      if isinstance(x, LNPheromone)]
+        pheromone_average = 0
+        if len(pheromones) > 0:
+            pheromone_average = np.ceil(sum(x.tracks for x in pheromones) / len(pheromones))
+
+        if model.threat_map[ant.pos] != len(threats) \
+                or model.threat_signature[ant.pos] != signature \
+                or model.nestmate_map[ant.pos] != \
+                model.get_number_of_agents_in_radius(ant.pos, NESTMATE_SEARCH_RADIUS, LNiger) \
+                or model.get_average_pheromone_tracks(ant.pos, TRAIL_SEARCH_RADIUS) != pheromone_average:
+            mismatches += 1
+    return mismatches
+
+
+def time_model(event_driven, check_maps=False):
+    """
+    Runs a model for STEP_COUNT steps and times its steps.
+    :param event_driven: Whether to run the model in event-driven mode.
+    :param check_maps: Whether to check the event-driven maps against the grid after every step. The check is
+    not included in the time.
+    :return: A tuple of the total step time in seconds and the total number of map mismatches found.
+    """
+    model = AntModel(NUM_LNIGER, NUM_FJAPON, NUM_MK_COL, NUM_FT_COL, GRID_WIDTH, GRID_HEIGHT,
+                     collect_interval=10, collect_agents=False, event_driven=event_driven)
+    step_time = 0
+    mismatches = count_event_map_mismatches(model) if check_maps else 0
+    for i in range(STEP_COUNT):
+        s = time()
+        model.step()
+        step_time += time() - s
+        if check_maps:
+            mismatches += count_event_map_mismatches(model)
+    return step_time, mismatches
+
+
+def main():
+    """
+    Times the baseline and event-driven models and checks the event-driven maps.
+    :return: 0 on success
+    """
+    baseline_time, _ = time_model(event_driven=False)
+    event_driven_time, _ = time_model(event_driven=True)
+    print("Baseline:", baseline_time, "s")
+    print("Event-driven:", event_driven_time, "s")
+    print("Speedup:", baseline_time / event_driven_time)
+
+    _, mismatches = time_model(event_driven=True, check_maps=True)
+    print("Event-driven map mismatches:", mismatches)
+
+    return 0
+
+
+if __name__ == "__main__":
+    main()
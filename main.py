@@ -17,6 +17,11 @@ NUM_FT_COL = 20
 GRID_WIDTH = 100
 GRID_HEIGHT = 100
 
+# Data collection settings
+COLLECT_INTERVAL = 10
+COLLECT_AGENTS = True
+AGENT_COLLECT_INTERVAL = 50
+
 
 def main():
     """
@@ -41,7 +46,10 @@ def main():
                                 "num_mk_col": mk_slider,
                                 "num_ft_col": ft_slider,
                                 "width": GRID_WIDTH,
-                                "height": GRID_HEIGHT})
+                                "height": GRID_HEIGHT,
+                                "collect_interval": COLLECT_INTERVAL,
+                                "collect_agents": COLLECT_AGENTS,
+                                "agent_collect_interval": AGENT_COLLECT_INTERVAL})
         server.port = 8521
         server.launch()
     else:
@@ -49,7 +57,10 @@ def main():
             sim_time_sum = 0
             print("Model Initialization #", str(j))
             s = time()
-            model = AntModel(NUM_LNIGER, NUM_FJAPON, NUM_MK_COL, NUM_FT_COL, GRID_WIDTH, GRID_HEIGHT)
+            model = AntModel(NUM_LNIGER, NUM_FJAPON, NUM_MK_COL, NUM_FT_COL, GRID_WIDTH, GRID_HEIGHT,
+                             collect_interval=COLLECT_INTERVAL,
+                             collect_agents=COLLECT_AGENTS,
+                             agent_collect_interval=AGENT_COLLECT_INTERVAL)
             e = time()
             sim_time_sum += e - s
             print(e-s)
@@ -65,9 +76,12 @@ def main():
                 if i % 10 == 0:
                     print(e-s)
             print("Model #", str(j), "complete. Total time", str(sim_time_sum))
-            df = model.data_collector.get_agent_vars_dataframe()
-            df = df.dropna(axis=0)
-            df.to_csv(path_or_buf="raw_new/out" + str(j) + ".csv")
+            if model.agent_data_collector is not None:
+                df = model.agent_data_collector.get_agent_vars_dataframe()
+                df = df.dropna(axis=0)
+                df.to_csv(path_or_buf="raw_new/out" + str(j) + ".csv")
+            df = model.data_collector.get_model_vars_dataframe()
+            df.to_csv(path_or_buf="raw_new/aggregate" + str(j) + ".csv")
 
     return 0
 